@@ -2,9 +2,11 @@
 # Copyright (c) 2025 Jeff Culverhouse
 import asyncio
 import argparse
+from collections.abc import Coroutine
 from json_logging import setup_logging, get_logger
 from mqtt_helper import MqttError
 from .core import Amcrest2Mqtt
+from typing import Any
 from mqtt_helper import ConfigError
 
 
@@ -50,9 +52,20 @@ async def async_main() -> int:
     return 0
 
 
+def run(coro: Coroutine[Any, Any, int]) -> int:
+    # uvloop is an optional speedup (the "uvloop" extra, installed in the Docker image);
+    # fall back to the stdlib event loop without it
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(coro)
+    result: int = uvloop.run(coro)
+    return result
+
+
 def main() -> int:
     try:
-        return asyncio.run(async_main())
+        return run(async_main())
     except RuntimeError as err:
         # Fallback for nested loops (Jupyter, tests, etc.)
         if "asyncio.run() cannot be called from a running event loop" in str(err):
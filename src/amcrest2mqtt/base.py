@@ -12,6 +12,7 @@ import os
 from paho.mqtt.client import Client
 from pathlib import Path
 from types import TracebackType
+import urllib3
 
 from typing import Any, cast, Self
 
@@ -42,6 +43,10 @@ class Base:
         self.mqtt_config = self.config["mqtt"]
         self.amcrest_config = self.config["amcrest"]
 
+        # silence certificate warnings once, up front, if the user turned off ssl_verify
+        if not self.amcrest_config.get("ssl_verify", True):
+            urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+
         self.service = self.mqtt_config["prefix"]
         self.service_name = f"{self.service} service"
         self.qos = self.mqtt_config["qos"]
@@ -54,8 +59,10 @@ class Base:
         self.devices: dict[str, Any] = {}
         self.states: dict[str, Any] = {}
         self.dirty: dict[str, set[tuple[str, str]]] = {}
+        self.stat_topics: dict[tuple[str, ...], str] = {}
+        self.discovery_payloads: dict[str, bytes] = {}
         self.amcrest_devices: dict[str, Any] = {}
-        self.events: list[str] = []
+        self.events: asyncio.Queue[dict[str, Any]] = asyncio.Queue(maxsize=10_000)
 
         self.mqttc: Client
         self.mqtt_connect_time: datetime
@@ -1,6 +1,6 @@
 from amcrest import ApiWrapper
 from argparse import Namespace
-from asyncio import AbstractEventLoop
+from asyncio import AbstractEventLoop, Queue
 from datetime import datetime
 from logging import Logger
 from mqtt_helper import MqttHelper
@@ -24,7 +24,8 @@ class AmcrestServiceProtocol(Protocol):
     device_list_interval: int
     devices: dict[str, Any]
     discovery_complete: bool
-    events: list
+    discovery_payloads: dict[str, bytes]
+    events: Queue[dict[str, Any]]
     last_call_date: datetime
     logger: Logger
     loop: AbstractEventLoop
@@ -40,6 +41,7 @@ class AmcrestServiceProtocol(Protocol):
     storage_update_interval: int
     snapshot_update_interval: int
     dirty: dict[str, set[tuple[str, str]]]
+    stat_topics: dict[tuple[str, ...], str]
     states: dict[str, Any]
 
     async def build_camera(self, camera: dict) -> str: ...
@@ -81,13 +83,16 @@ class AmcrestServiceProtocol(Protocol):
     async def mqtt_on_subscribe(self, client: Client, userdata: Any, mid: int, reason_code_list: list[ReasonCode], properties: Properties) -> None: ...
     async def mqtt_on_log(self, client: Client, userdata: Any, paho_log_level: int, msg: str) -> None: ...
     async def mqttc_create(self) -> None: ...
+    async def next_event(self) -> dict[str, Any]: ...
     async def process_device_event(self, device_id: str, code: str, payload: Any) -> None: ...
     async def publish_device_availability(self, device_id: str, online: bool = True) -> None: ...
-    async def publish_device_discovery(self, device_id: str) -> None: ...
+    async def publish_device_discovery(self, *device_ids: str) -> None: ...
     async def publish_device_state(self, device_id: str, subject: str = "", sub: str = "", publish_all: bool = False) -> None: ...
+    async def publish_messages(self, messages: list[tuple[str, Any]]) -> None: ...
     async def publish_service_availability(self, status: str = "online") -> None: ...
     async def publish_service_discovery(self) -> None: ...
     async def publish_service_state(self) -> None: ...
+    async def reboot_device(self, device_id: str) -> None: ...
     async def rediscover_all(self) -> None: ...
     async def refresh_all_devices(self) -> None: ...
     async def set_motion_detection(self, device_id: str, switch: bool) -> None: ...
@@ -103,11 +108,13 @@ class AmcrestServiceProtocol(Protocol):
     def assert_no_tuples(self, data: Any, path: str = "root") -> None: ...
     def b_to_gb(self, total: int) -> float: ...
     def b_to_mb(self, total: int) -> float: ...
+    def build_service_discovery(self) -> dict[str, Any]: ...
     def classify_device(self, device: dict) -> str: ...
+    def drain_events(self, max_n: int = 256) -> list[dict[str, Any]]: ...
     def get_component(self, device_id: str) -> dict[str, Any]: ...
     def get_device_name(self, device_id: str) -> str: ...
     def get_device_name_slug(self, device_id: str) -> str: ...
-    def get_next_event(self) -> dict[str, Any] | None: ...
+    def get_stat_t(self, device_id: str, *parts: str) -> str: ...
     def handle_signal(self, signum: int, _: FrameType | None) -> Any: ...
     def heartbeat_ready(self) -> None: ...
     def increase_api_calls(self) -> None: ...
@@ -118,9 +125,9 @@ class AmcrestServiceProtocol(Protocol):
     def load_config(self, config_arg: Any | None) -> dict[str, Any]: ...
     def mark_ready(self) -> None: ...
     def mb_to_b(self, total: int) -> int: ...
+    def mqtt_on_socket_open(self, client: Client, userdata: Any, sock: Any) -> None: ...
     def read_file(self, file_name: str) -> str: ...
     def _read_version_file(self) -> str: ...
-    def reboot_device(self, device_id: str) -> None: ...
     def restore_state(self) -> None: ...
     def save_state(self) -> None: ...
     def upsert_device(self, device_id: str, **kwargs: dict[str, Any] | str | int | bool) -> bool: ...
@@ -113,7 +113,13 @@ class AmcrestMixin:
 
         device = {
             "stat_t": self.mqtt_helper.stat_t(device_id, "state"),
-            "avty_t": self.mqtt_helper.avty_t(device_id),
+            # tie each camera to the service availability too, so a single service "offline"
+            # (on shutdown, or from the broker) marks every camera unavailable at once
+            "avty": [
+                {"t": self.mqtt_helper.avty_t(device_id)},
+                {"t": self.mqtt_helper.avty_t("service")},
+            ],
+            "avty_mode": "all",
             "device": {
                 "name": camera["device_name"],
                 "identifiers": [
@@ -279,7 +285,9 @@ class AmcrestMixin:
                 "icon": "mdi:person",
             }
 
-        self.upsert_device(device_id, component=device)
+        if self.upsert_device(device_id, component=device):
+            # the cached discovery payload no longer matches this component
+            self.discovery_payloads.pop(device_id, None)
         # initial states because many of these won't update until something happens
         # or this is the only time we'll ever set them
         self.upsert_state(
@@ -11,6 +11,8 @@ from datetime import datetime, timedelta
 import random
 from typing import TYPE_CHECKING, Any, cast
 
+from amcrest2mqtt.mixins.events import SNAPSHOT_EXTENSIONS
+
 if TYPE_CHECKING:
     from amcrest2mqtt.interface import AmcrestServiceProtocol as Amcrest2Mqtt
 
@@ -23,11 +25,6 @@ class AmcrestAPIMixin:
         self.api_calls += 1
 
     async def connect_to_devices(self: Amcrest2Mqtt) -> dict[str, Any]:
-        if not self.amcrest_config.get("ssl_verify", True):
-            import urllib3
-
-            urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
-
         semaphore = asyncio.Semaphore(5)
 
         async def _connect_device(host: str, name: str, index: int) -> None:
@@ -44,7 +41,7 @@ class AmcrestAPIMixin:
         await asyncio.gather(*tasks)
 
         self.logger.info("connecting to Amcrest hosts done")
-        return {d: self.amcrest_devices[d]["config"] for d in self.amcrest_devices.keys()}
+        return {device_id: device["config"] for device_id, device in self.amcrest_devices.items()}
 
     async def get_camera(self: Amcrest2Mqtt, host: str) -> ApiWrapper:
         config = self.amcrest_config
@@ -159,7 +156,7 @@ class AmcrestAPIMixin:
             },
         }
 
-    def reboot_device(self: Amcrest2Mqtt, device_id: str) -> None:
+    async def reboot_device(self: Amcrest2Mqtt, device_id: str) -> None:
         if device_id not in self.amcrest_devices:
             self.logger.warning(f"device not found for '{self.get_device_name(device_id)}'")
             return None
@@ -168,7 +165,16 @@ class AmcrestAPIMixin:
             self.logger.warning(f"camera not found for '{self.get_device_name(device_id)}'")
             return None
 
-        response = device["camera"].reboot().strip()
+        try:
+            response = str(await device["camera"].async_reboot()).strip()
+        except CommError as err:
+            self.logger.error(f"failed to reboot ('{self.get_device_name(device_id)}'): {err!r}")
+            return None
+        except LoginError as err:
+            self.logger.error(f"failed to auth to device ('{self.get_device_name(device_id)}'): {err!r}")
+            return None
+
+        self.increase_api_calls()
         self.logger.debug(f"sent reboot signal to '{self.get_device_name(device_id)}', {response}")
         if response == "OK":
             self.upsert_state(device_id, internal={"reboot": datetime.now()})
@@ -271,9 +277,9 @@ class AmcrestAPIMixin:
 
         # Extract Enable value from the parsed dictionary
         enable_value = None
-        for key in privacy:
+        for key, value in privacy.items():
             if key.endswith(".Enable") or key == "Enable":
-                enable_value = privacy[key]
+                enable_value = value
                 break
 
         if enable_value is None:
@@ -440,7 +446,8 @@ class AmcrestAPIMixin:
                 if self.is_rebooting(device_id):
                     return None
 
-                data_raw = cast(bytes, device["camera"].download_file(file))
+                # the amcrest library has no async download, so keep the (possibly large) transfer off the event loop
+                data_raw = cast(bytes, await asyncio.to_thread(device["camera"].download_file, file))
                 self.increase_api_calls()
                 if data_raw:
                     if not encode:
@@ -485,6 +492,10 @@ class AmcrestAPIMixin:
                     return None
 
                 async for code, payload in camera.async_event_actions("All"):
+                    # snapshot files are only used for vision requests, drop them here otherwise
+                    if code == "NewFile" and not self.config.get("vision_request"):
+                        if payload.get("data", {}).get("File", "").lower().endswith(SNAPSHOT_EXTENSIONS):
+                            continue
                     await self.process_device_event(device_id, code, payload)
                 self.increase_api_calls()
                 return
@@ -508,18 +519,18 @@ class AmcrestAPIMixin:
         try:
             if (code == "ProfileAlarmTransmit" and config["is_ad110"]) or (code == "VideoMotion" and not config["is_ad110"]):
                 motion_payload = {"state": "on" if payload["action"] == "Start" else "off", "region": ", ".join(payload["data"]["RegionName"])}
-                self.events.append({"device_id": device_id, "event": "motion", "payload": motion_payload})
+                await self.events.put({"device_id": device_id, "event": "motion", "payload": motion_payload})
             elif code == "CrossRegionDetection" and payload["data"]["ObjectType"] == "Human":
                 human_payload = "on" if payload["action"] == "Start" else "off"
-                self.events.append({"device_id": device_id, "event": "human", "payload": human_payload})
+                await self.events.put({"device_id": device_id, "event": "human", "payload": human_payload})
             elif code == "_DoTalkAction_" and not config["is_ad410"]:
                 # AD410 fires both _DoTalkAction_ and AlarmLocal on a doorbell press;
                 # only AlarmLocal has a clean Start/Stop lifecycle, so skip this for AD410
                 doorbell_payload = "on" if payload["data"]["Action"] == "Invite" else "off"
-                self.events.append({"device_id": device_id, "event": "doorbell", "payload": doorbell_payload})
+                await self.events.put({"device_id": device_id, "event": "doorbell", "payload": doorbell_payload})
             elif code == "AlarmLocal" and config["is_ad410"]:
                 doorbell_payload = "on" if payload["action"] == "Start" else "off"
-                self.events.append({"device_id": device_id, "event": "doorbell", "payload": doorbell_payload})
+                await self.events.put({"device_id": device_id, "event": "doorbell", "payload": doorbell_payload})
             elif code == "NewFile":
                 if (
                     "File" in payload["data"]
@@ -527,17 +538,17 @@ class AmcrestAPIMixin:
                     and ("StoragePoint" not in payload["data"] or payload["data"]["StoragePoint"] != "Temporary")
                 ):
                     file_payload = {"file": payload["data"]["File"], "size": payload["data"]["Size"]}
-                    self.events.append({"device_id": device_id, "event": "recording", "payload": file_payload})
+                    await self.events.put({"device_id": device_id, "event": "recording", "payload": file_payload})
             elif code == "LensMaskOpen":
                 device["privacy_mode"] = True
-                self.events.append({"device_id": device_id, "event": "privacy_mode", "payload": "on"})
+                await self.events.put({"device_id": device_id, "event": "privacy_mode", "payload": "on"})
             elif code == "LensMaskClose":
                 device["privacy_mode"] = False
-                self.events.append({"device_id": device_id, "event": "privacy_mode", "payload": "off"})
+                await self.events.put({"device_id": device_id, "event": "privacy_mode", "payload": "off"})
 
             # lets send these but not bother logging them here
             elif code in ["TimeChange", "NTPAdjustTime", "RtspSessionDisconnect"]:
-                self.events.append({"device_id": device_id, "event": code, "payload": payload["action"]})
+                await self.events.put({"device_id": device_id, "event": code, "payload": payload["action"]})
 
             # lets just ignore these completely
             elif code in ["InterVideoAccess", "VideoMotionInfo"]:
@@ -546,9 +557,15 @@ class AmcrestAPIMixin:
             # save everything else as a 'generic' event
             else:
                 self.logger.info(f"logged event on '{self.get_device_name(device_id)}' - {code}: {payload}")
-                self.events.append({"device_id": device_id, "event": code, "payload": payload})
+                await self.events.put({"device_id": device_id, "event": code, "payload": payload})
         except Exception as err:
             self.logger.error(f"failed to process event from '{self.get_device_name(device_id)}': {err!r}")
 
-    def get_next_event(self: Amcrest2Mqtt) -> dict[str, Any] | None:
-        return self.events.pop(0) if len(self.events) > 0 else None
+    async def next_event(self: Amcrest2Mqtt) -> dict[str, Any]:
+        return await self.events.get()
+
+    def drain_events(self: Amcrest2Mqtt, max_n: int = 256) -> list[dict[str, Any]]:
+        drained: list[dict[str, Any]] = []
+        while not self.events.empty() and len(drained) < max_n:
+            drained.append(self.events.get_nowait())
+        return drained
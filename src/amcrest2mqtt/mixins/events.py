@@ -4,12 +4,15 @@ from __future__ import annotations
 
 import asyncio
 from datetime import datetime
-import json
+import orjson
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from amcrest2mqtt.interface import AmcrestServiceProtocol as Amcrest2Mqtt
 
+SNAPSHOT_EXTENSIONS = (".jpg", ".jpeg")
+RECORDING_EXTENSIONS = (".mp4",)
+
 
 class EventsMixin:
     async def publish_vision_request(self: Amcrest2Mqtt, device_id: str, image_b64: str, source: str) -> None:
@@ -25,13 +28,16 @@ class EventsMixin:
             "timestamp": now.isoformat(timespec="seconds"),
             "source": source,
         }
-        await asyncio.to_thread(self.mqtt_helper.safe_publish, topic, json.dumps(payload))
+        await asyncio.to_thread(self.mqtt_helper.safe_publish, topic, orjson.dumps(payload))
         self.logger.debug(f"published vision request for '{self.get_device_name(device_id)}' ({source})")
 
     async def check_for_events(self: Amcrest2Mqtt) -> None:
         needs_publish = set()
 
-        while device_event := self.get_next_event():
+        # wait for the next event, then take whatever else has queued up behind it
+        device_events = [await self.next_event(), *self.drain_events()]
+
+        for device_event in device_events:
             if "device_id" not in device_event:
                 continue
 
@@ -45,13 +51,14 @@ class EventsMixin:
                 event_type = event
                 if event == "recording" and "file" in payload:
                     self.logger.debug(f'recording event for \'{self.get_device_name(device_id)}\': {payload["file"]}')
-                    if payload["file"].endswith(".jpg"):
+                    lower_name = payload["file"].lower()
+                    if lower_name.endswith(SNAPSHOT_EXTENSIONS):
                         image = await self.get_recorded_file(device_id, payload["file"])
                         if image:
                             await self.publish_vision_request(device_id, image, "recording_snapshot")
                             needs_publish.add(device_id)
                             event += ": snapshot"
-                    elif payload["file"].endswith(".mp4"):
+                    elif lower_name.endswith(RECORDING_EXTENSIONS):
                         if "path" in self.config["media"] and self.states[device_id]["switch"].get("save_recordings", "OFF") == "ON":
                             file_name = await self.store_recording_in_media(device_id, payload["file"])
                             if file_name:
@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 import asyncio
+import copy
 from deepmerge.merger import Merger
+from functools import cache
 import ipaddress
 from mqtt_helper import ConfigError
 import os
@@ -23,6 +25,16 @@ if TYPE_CHECKING:
 
 READY_FILE = os.getenv("READY_FILE", "/tmp/amcrest2mqtt.ready")
 
+_MISSING = object()
+
+# libyaml's C parser when PyYAML was built with it, otherwise the pure-Python one
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+@cache
+def slugify(name: str) -> str:
+    return re.sub(r"[^a-zA-Z0-9]+", "_", name.lower())
+
 
 class HelpersMixin:
     async def build_device_states(self: Amcrest2Mqtt, device_id: str) -> bool:
@@ -66,7 +78,7 @@ class HelpersMixin:
             case "privacy":
                 await self.set_privacy_mode(device_id, message == "ON")
             case "reboot":
-                self.reboot_device(device_id)
+                await self.reboot_device(device_id)
 
     async def handle_service_command(self: Amcrest2Mqtt, handler: str, message: Any) -> None:
         try:
@@ -96,8 +108,9 @@ class HelpersMixin:
     async def rediscover_all(self: Amcrest2Mqtt) -> None:
         await self.publish_service_discovery()
         await self.publish_service_state()
-        for device_id in list(self.devices):
-            await self.publish_device_discovery(device_id)
+        device_ids = list(self.devices)
+        await self.publish_device_discovery(*device_ids)
+        for device_id in device_ids:
             await self.publish_device_state(device_id, publish_all=True)
 
     # Utility functions ---------------------------------------------------------------------------
@@ -179,7 +192,7 @@ class HelpersMixin:
         if os.path.exists(config_file):
             try:
                 with open(config_file, "r", encoding="utf-8") as f:
-                    config = yaml.safe_load(f) or {}
+                    config = yaml.load(f, Loader=YAML_LOADER) or {}
                 config_from = "file"
             except Exception as err:
                 raise ConfigError(f"found {config_file} but failed to load: {err}")
@@ -362,7 +375,15 @@ class HelpersMixin:
         return cast(str, self.devices[device_id]["component"]["device"]["name"])
 
     def get_device_name_slug(self: Amcrest2Mqtt, device_id: str) -> str:
-        return re.sub(r"[^a-zA-Z0-9]+", "_", self.get_device_name(device_id).lower())
+        return slugify(self.get_device_name(device_id))
+
+    def get_stat_t(self: Amcrest2Mqtt, device_id: str, *parts: str) -> str:
+        # state topics never change for a given device/section/key, so build each one only once
+        key = (device_id, *parts)
+        topic = self.stat_topics.get(key)
+        if topic is None:
+            topic = self.stat_topics[key] = self.mqtt_helper.stat_t(device_id, *parts)
+        return topic
 
     def get_component(self: Amcrest2Mqtt, device_id: str) -> dict[str, Any]:
         return cast(dict[str, Any], self.devices[device_id]["component"])
@@ -391,7 +412,8 @@ class HelpersMixin:
             ["override"],
             ["override"],
         )
-        prev = self.devices.get(device_id, {})
+        # merge() updates the existing dicts in place, so compare against a copy
+        prev = copy.deepcopy(self.devices.get(device_id, {}))
         for section, data in kwargs.items():
             # Pre-merge check
             self.assert_no_tuples(data, f"device[{device_id}].{section}")
@@ -408,19 +430,29 @@ class HelpersMixin:
             ["override"],
             ["override"],
         )
-        prev = self.states.get(device_id, {})
+        changed = False
         if device_id not in self.dirty:
             self.dirty[device_id] = set()
         for section, data in kwargs.items():
             self.assert_no_tuples(data, f"state[{device_id}].{section}")
+            # merge() updates the existing dicts in place, so keep a copy of what was there
+            # (deepcopy would replace the _MISSING sentinel, so only copy a section that exists)
+            current = self.states.get(device_id, {})
+            before = copy.deepcopy(current[section]) if section in current else _MISSING
             merged = MERGER.merge(self.states.get(device_id, {}), {section: data})
             self.assert_no_tuples(merged, f"state[{device_id}].{section} (post-merge)")
             self.states[device_id] = merged
-            # track which (section, key) pairs were touched for dicts
+            after = merged[section]
+            # only mark (section, key) pairs dirty when their value actually changed,
+            # so publish_device_state never resends a retained value the broker already has
             if isinstance(data, dict):
+                if before is _MISSING:
+                    changed = True
                 for k in data:
-                    self.dirty[device_id].add((section, k))
-            else:
+                    if not isinstance(before, dict) or before.get(k, _MISSING) != after.get(k):
+                        self.dirty[device_id].add((section, k))
+                        changed = True
+            elif before != after:
                 self.dirty[device_id].add((section, ""))
-        new = self.states.get(device_id, {})
-        return False if prev == new else True
+                changed = True
+        return changed
@@ -31,11 +31,10 @@ class LoopsMixin:
 
     async def check_event_queue_loop(self: Amcrest2Mqtt) -> None:
         while self.running:
-            await self.check_for_events()
             try:
-                await asyncio.sleep(1)
+                await self.check_for_events()
             except asyncio.CancelledError:
-                self.logger.debug("check_event_queue_loop cancelled during sleep")
+                self.logger.debug("check_event_queue_loop cancelled while waiting for events")
                 break
 
     async def collect_snapshots_loop(self: Amcrest2Mqtt) -> None:
@@ -77,6 +76,10 @@ class LoopsMixin:
         self.running = True
         self.mark_ready()
 
+        # start each task eagerly: loops (and the per-device tasks they gather) that don't hit a real wait
+        # finish their first step inline instead of costing an extra trip through the event loop
+        asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+
         tasks = [
             asyncio.create_task(self.device_loop(), name="device_loop"),
             asyncio.create_task(self.collect_events_loop(), name="collect events loop"),
@@ -2,6 +2,7 @@
 # Copyright (c) 2025 Jeff Culverhouse
 from __future__ import annotations
 
+import socket
 from typing import TYPE_CHECKING, Any
 
 from mqtt_helper import BaseMqttMixin, decode_mqtt_payload, parse_device_topic
@@ -10,8 +11,32 @@ from paho.mqtt.client import Client, MQTTMessage
 if TYPE_CHECKING:
     from amcrest2mqtt.interface import AmcrestServiceProtocol as Amcrest2Mqtt
 
+# cap on paho's outgoing queue; with qos > 0 it otherwise grows without limit while the broker is away
+MQTT_MAX_QUEUED = 1024
+
+# first bytes that can begin a JSON document
+_JSON_START = frozenset(b'{["0123456789-tfn \t\r\n')
+
 
 class MqttMixin(BaseMqttMixin):
+    async def mqttc_create(self: Amcrest2Mqtt) -> None:
+        # self is typed as the service protocol, whose stub mypy resolves super() against
+        await super().mqttc_create()  # type: ignore[safe-super]
+        self.mqttc.max_queued_messages_set(MQTT_MAX_QUEUED)
+
+        # cover reconnects, plus the socket the first connect may already have opened
+        self.mqttc.on_socket_open = self.mqtt_on_socket_open
+        sock = self.mqttc.socket()
+        if sock is not None:
+            self.mqtt_on_socket_open(self.mqttc, None, sock)
+
+    def mqtt_on_socket_open(self: Amcrest2Mqtt, client: Client, userdata: Any, sock: Any) -> None:
+        # state updates go out as bursts of tiny packets, don't let Nagle hold them back waiting on ACKs
+        try:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        except (AttributeError, OSError) as err:
+            self.logger.debug(f"could not set TCP_NODELAY on mqtt socket: {err!r}")
+
     def mqtt_subscription_topics(self: Amcrest2Mqtt) -> list[str]:
         return [
             "homeassistant/status",
@@ -25,7 +50,14 @@ class MqttMixin(BaseMqttMixin):
         topic = msg.topic
         components = topic.split("/")
 
-        payload = decode_mqtt_payload(msg.payload)
+        raw = msg.payload
+        payload: Any
+        # our usual commands (ON/OFF/PRESS/online) can never parse as JSON, so don't make
+        # the decoder try; anything that could be JSON (numbers, objects, true/false) still goes through it
+        if raw and len(raw) < 16 and raw[0] not in _JSON_START:
+            payload = raw.decode("utf-8", errors="replace")
+        else:
+            payload = decode_mqtt_payload(raw)
         if payload is None:
             return None
 
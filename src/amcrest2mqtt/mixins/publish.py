@@ -4,18 +4,28 @@ from __future__ import annotations
 
 import asyncio
 from datetime import timezone
-import json
-from typing import TYPE_CHECKING
+import orjson
+from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     from amcrest2mqtt.interface import AmcrestServiceProtocol as Amcrest2Mqtt
 
 
 class PublishMixin:
+    async def publish_messages(self: Amcrest2Mqtt, messages: list[tuple[str, Any]]) -> None:
+        # hand a whole batch of (topic, payload) pairs to one worker thread instead of one thread hop per message
+        if not messages:
+            return
+
+        def _publish_all() -> None:
+            for topic, payload in messages:
+                self.mqtt_helper.safe_publish(topic, payload)
+
+        await asyncio.to_thread(_publish_all)
 
     # Service -------------------------------------------------------------------------------------
 
-    async def publish_service_discovery(self: Amcrest2Mqtt) -> None:
+    def build_service_discovery(self: Amcrest2Mqtt) -> dict[str, Any]:
         device_id = "service"
 
         device = {
@@ -120,9 +130,18 @@ class PublishMixin:
             },
         }
 
+        return {k: v for k, v in device.items() if k != "p"}
+
+    async def publish_service_discovery(self: Amcrest2Mqtt) -> None:
+        device_id = "service"
+
+        # nothing in the service discovery payload changes while we run, so only serialize it once
+        payload = self.discovery_payloads.get(device_id)
+        if payload is None:
+            payload = self.discovery_payloads[device_id] = orjson.dumps(self.build_service_discovery())
+
         topic = self.mqtt_helper.disc_t("device", device_id)
-        payload = {k: v for k, v in device.items() if k != "p"}
-        await asyncio.to_thread(self.mqtt_helper.safe_publish, topic, json.dumps(payload))
+        await asyncio.to_thread(self.mqtt_helper.safe_publish, topic, payload)
         self.upsert_state(device_id, internal={"discovered": True})
 
         self.logger.debug(f"discovery published for {self.service} ({self.mqtt_helper.service_slug})")
@@ -133,35 +152,36 @@ class PublishMixin:
     async def publish_service_state(self: Amcrest2Mqtt) -> None:
         # we keep last_call_date in localtime so it rolls-over the api call counter
         # at the right time (midnight, local) but we want to send last_call_date
-        # to HomeAssistant as UTC
-        last_call_date = self.last_call_date
-        local_tz = last_call_date.astimezone().tzinfo
-
+        # to HomeAssistant as UTC (astimezone() already treats a naive datetime as localtime)
         service = {
             "server": "online",
             "api_calls": self.api_calls,
-            "last_call": last_call_date.replace(tzinfo=local_tz).astimezone(timezone.utc).isoformat(),
+            "last_call": self.last_call_date.astimezone(timezone.utc).isoformat(),
             "refresh_interval": self.device_interval,
             "storage_interval": self.storage_update_interval,
             "snapshot_interval": self.snapshot_update_interval,
             "rate_limited": "YES" if self.rate_limited else "NO",
         }
 
-        for key, value in service.items():
-            await asyncio.to_thread(
-                self.mqtt_helper.safe_publish,
-                self.mqtt_helper.stat_t("service", "service", key),
-                json.dumps(value) if isinstance(value, dict) else value,
-            )
+        await self.publish_messages(
+            [(self.get_stat_t("service", "service", key), orjson.dumps(value) if isinstance(value, dict) else value) for key, value in service.items()]
+        )
 
     # Devices -------------------------------------------------------------------------------------
 
-    async def publish_device_discovery(self: Amcrest2Mqtt, device_id: str) -> None:
-        topic = self.mqtt_helper.disc_t("device", device_id)
-        payload = json.dumps(self.devices[device_id]["component"])
-
-        await asyncio.to_thread(self.mqtt_helper.safe_publish, topic, payload)
-        self.upsert_state(device_id, internal={"discovered": True})
+    async def publish_device_discovery(self: Amcrest2Mqtt, *device_ids: str) -> None:
+        # several devices can be announced in one burst (e.g. on rediscovery)
+        messages: list[tuple[str, Any]] = []
+        for device_id in device_ids:
+            # components only change when build_camera sees different device info, so reuse the
+            # serialized payload until then (build_camera drops it from the cache)
+            payload = self.discovery_payloads.get(device_id)
+            if payload is None:
+                payload = self.discovery_payloads[device_id] = orjson.dumps(self.devices[device_id]["component"])
+            messages.append((self.mqtt_helper.disc_t("device", device_id), payload))
+        await self.publish_messages(messages)
+        for device_id in device_ids:
+            self.upsert_state(device_id, internal={"discovered": True})
 
     async def publish_device_availability(self: Amcrest2Mqtt, device_id: str, online: bool = True) -> None:
         topic = self.mqtt_helper.avty_t(device_id)
@@ -191,24 +211,27 @@ class PublishMixin:
                 else:
                     items[section] = all_state[section]
 
+        messages: list[tuple[str, Any]] = []
         for state, value in list(items.items()):
             if subject and state != subject:
                 continue
             # Attributes need to be published as a single JSON object to the attributes topic
             if state == "attributes" and isinstance(value, dict):
-                topic = self.mqtt_helper.stat_t(device_id, "attributes")
-                await asyncio.to_thread(self.mqtt_helper.safe_publish, topic, json.dumps(value))
+                messages.append((self.get_stat_t(device_id, "attributes"), orjson.dumps(value)))
             elif isinstance(value, dict):
                 for k, v in list(value.items()):
                     if sub and k != sub:
                         continue
-                    topic = self.mqtt_helper.stat_t(device_id, state, k)
-                    if isinstance(v, (list, bool)):
-                        v = json.dumps(v)
-                    await asyncio.to_thread(self.mqtt_helper.safe_publish, topic, v)
+                    # bools are the only scalars HA expects as JSON, and those don't need the encoder
+                    if isinstance(v, bool):
+                        v = b"true" if v else b"false"
+                    elif isinstance(v, list):
+                        v = orjson.dumps(v)
+                    messages.append((self.get_stat_t(device_id, state, k), v))
             else:
-                topic = self.mqtt_helper.stat_t(device_id, state)
-                await asyncio.to_thread(self.mqtt_helper.safe_publish, topic, value)
+                messages.append((self.get_stat_t(device_id, state), value))
+
+        await self.publish_messages(messages)
 
         # clear dirty keys for this device after publishing
         self.dirty.pop(device_id, None)
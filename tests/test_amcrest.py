@@ -1,8 +1,12 @@
 # SPDX-License-Identifier: MIT
 # Copyright (c) 2025 Jeff Culverhouse
-from unittest.mock import MagicMock
+import asyncio
+import threading
+from amcrest.exceptions import CommError
+from unittest.mock import AsyncMock, MagicMock
 
 from amcrest2mqtt.mixins.amcrest import AmcrestMixin
+from amcrest2mqtt.mixins.helpers import HelpersMixin
 from amcrest2mqtt.mixins.amcrest_api import AmcrestAPIMixin
 
 
@@ -83,12 +87,71 @@ class TestClassifyDevice:
         assert amcrest.classify_device(device) == "doorbell"
 
 
+class FakeCameraBuilder(HelpersMixin, AmcrestMixin):
+    def __init__(self):
+        self.logger = MagicMock()
+        self.service = "amcrest2mqtt"
+        self.service_name = "amcrest2mqtt service"
+        self.qos = 0
+        self.config = {"version": "v0.1.0-test", "media": {}}
+        self.amcrest_config = {}
+        self.mqtt_helper = MagicMock()
+        self.mqtt_helper.avty_t = MagicMock(side_effect=lambda *args: "/".join(["amcrest2mqtt", *args, "availability"]))
+        self.devices = {}
+        self.states = {}
+        self.dirty = {}
+        self.discovery_payloads = {}
+        self.publish_device_discovery = AsyncMock()
+        self.publish_device_availability = AsyncMock()
+        self.publish_device_state = AsyncMock()
+
+
+def _camera(serial="CAM001"):
+    return {
+        "serial_number": serial,
+        "device_name": "Front Yard",
+        "vendor": "Amcrest",
+        "device_type": "IP8M-2496E",
+        "software_version": "2.800",
+        "hardware_version": "1.00",
+        "host": "192.168.1.100",
+        "network": {"mac": "AA:BB:CC:DD:EE:FF", "ip_address": "192.168.1.100"},
+    }
+
+
+class TestBuildCamera:
+    def test_availability_includes_service_topic(self):
+        builder = FakeCameraBuilder()
+
+        asyncio.run(builder.build_camera(_camera()))
+
+        component = builder.devices["CAM001"]["component"]
+        assert component["avty"] == [
+            {"t": "amcrest2mqtt/CAM001/availability"},
+            {"t": "amcrest2mqtt/service/availability"},
+        ]
+        assert component["avty_mode"] == "all"
+
+    def test_changed_camera_drops_cached_discovery(self):
+        builder = FakeCameraBuilder()
+        asyncio.run(builder.build_camera(_camera()))
+        builder.discovery_payloads["CAM001"] = b"{}"
+
+        asyncio.run(builder.build_camera(_camera()))
+        assert builder.discovery_payloads["CAM001"] == b"{}"
+
+        camera = _camera()
+        camera["software_version"] = "2.900"
+        asyncio.run(builder.build_camera(camera))
+        assert "CAM001" not in builder.discovery_payloads
+
+
 class FakeEventProcessor(AmcrestAPIMixin):
     def __init__(self):
         self.logger = MagicMock()
         self.devices = {}
         self.states = {}
-        self.events = []
+        self.events = asyncio.Queue()
         self.amcrest_devices = {}
 
     def get_device_name(self, device_id):
@@ -109,8 +172,6 @@ class FakeEventProcessor(AmcrestAPIMixin):
 
 class TestProcessDeviceEvent:
     def _run(self, coro):
-        import asyncio
-
         return asyncio.run(coro)
 
     def test_alarm_local_ad410_start_creates_doorbell_on(self):
@@ -118,18 +179,20 @@ class TestProcessDeviceEvent:
         ep._add_device("DB001", is_ad410=True)
         payload = {"action": "Start", "data": {}}
         self._run(ep.process_device_event("DB001", "AlarmLocal", payload))
-        assert len(ep.events) == 1
-        assert ep.events[0]["event"] == "doorbell"
-        assert ep.events[0]["payload"] == "on"
+        events = ep.drain_events()
+        assert len(events) == 1
+        assert events[0]["event"] == "doorbell"
+        assert events[0]["payload"] == "on"
 
     def test_alarm_local_ad410_stop_creates_doorbell_off(self):
         ep = FakeEventProcessor()
         ep._add_device("DB001", is_ad410=True)
         payload = {"action": "Stop", "data": {}}
         self._run(ep.process_device_event("DB001", "AlarmLocal", payload))
-        assert len(ep.events) == 1
-        assert ep.events[0]["event"] == "doorbell"
-        assert ep.events[0]["payload"] == "off"
+        events = ep.drain_events()
+        assert len(events) == 1
+        assert events[0]["event"] == "doorbell"
+        assert events[0]["payload"] == "off"
 
     def test_alarm_local_ignored_for_non_ad410(self):
         ep = FakeEventProcessor()
@@ -137,17 +200,19 @@ class TestProcessDeviceEvent:
         payload = {"action": "Start", "data": {}}
         self._run(ep.process_device_event("CAM001", "AlarmLocal", payload))
         # should fall through to generic event, not doorbell
-        assert len(ep.events) == 1
-        assert ep.events[0]["event"] == "AlarmLocal"
+        events = ep.drain_events()
+        assert len(events) == 1
+        assert events[0]["event"] == "AlarmLocal"
 
     def test_do_talk_action_creates_doorbell_event_for_ad110(self):
         ep = FakeEventProcessor()
         ep._add_device("DB001", is_ad110=True)
         payload = {"action": "Start", "data": {"Action": "Invite"}}
         self._run(ep.process_device_event("DB001", "_DoTalkAction_", payload))
-        assert len(ep.events) == 1
-        assert ep.events[0]["event"] == "doorbell"
-        assert ep.events[0]["payload"] == "on"
+        events = ep.drain_events()
+        assert len(events) == 1
+        assert events[0]["event"] == "doorbell"
+        assert events[0]["payload"] == "on"
 
     def test_do_talk_action_ignored_for_ad410(self):
         ep = FakeEventProcessor()
@@ -155,4 +220,134 @@ class TestProcessDeviceEvent:
         payload = {"action": "Start", "data": {"Action": "Invite"}}
         self._run(ep.process_device_event("DB001", "_DoTalkAction_", payload))
         # AD410 uses AlarmLocal for doorbell, _DoTalkAction_ should be ignored
-        assert all(e["event"] != "doorbell" for e in ep.events)
+        assert all(e["event"] != "doorbell" for e in ep.drain_events())
+
+    def test_next_event_returns_events_in_order(self):
+        ep = FakeEventProcessor()
+        ep._add_device("CAM001")
+
+        async def _collect():
+            await ep.process_device_event("CAM001", "LensMaskOpen", {"action": "Start", "data": {}})
+            await ep.process_device_event("CAM001", "LensMaskClose", {"action": "Start", "data": {}})
+            return [await ep.next_event(), await ep.next_event()]
+
+        events = self._run(_collect())
+        assert [e["payload"] for e in events] == ["on", "off"]
+        assert ep.events.empty()
+
+    def test_drain_events_respects_max_n(self):
+        ep = FakeEventProcessor()
+        ep._add_device("CAM001")
+        for _ in range(5):
+            self._run(ep.process_device_event("CAM001", "LensMaskOpen", {"action": "Start", "data": {}}))
+
+        assert len(ep.drain_events(max_n=3)) == 3
+        assert len(ep.drain_events()) == 2
+        assert ep.drain_events() == []
+
+
+class TestGetEventsFromDevice:
+    def _run(self, coro):
+        return asyncio.run(coro)
+
+    def _make(self, events, vision_request=False):
+        ep = FakeEventProcessor()
+        ep._add_device("CAM001")
+        ep.config = {"vision_request": vision_request}
+        ep.is_rebooting = MagicMock(return_value=False)
+        ep.increase_api_calls = MagicMock()
+
+        async def _event_actions(codes):
+            for event in events:
+                yield event
+
+        ep.amcrest_devices["CAM001"]["camera"].async_event_actions = _event_actions
+        return ep
+
+    def test_drops_jpg_new_file_without_vision_request(self):
+        jpg = ("NewFile", {"action": "Pulse", "data": {"File": "/mnt/sd/snap.jpg", "Size": 1}})
+        mp4 = ("NewFile", {"action": "Pulse", "data": {"File": "/mnt/sd/clip.mp4", "Size": 1}})
+        ep = self._make([jpg, mp4])
+
+        self._run(ep.get_events_from_device("CAM001"))
+
+        events = ep.drain_events()
+        assert len(events) == 1
+        assert events[0]["payload"]["file"] == "/mnt/sd/clip.mp4"
+
+    def test_drops_uppercase_snapshot_extensions(self):
+        jpg = ("NewFile", {"action": "Pulse", "data": {"File": "/mnt/sd/SNAP.JPG", "Size": 1}})
+        jpeg = ("NewFile", {"action": "Pulse", "data": {"File": "/mnt/sd/snap.jpeg", "Size": 1}})
+        ep = self._make([jpg, jpeg])
+
+        self._run(ep.get_events_from_device("CAM001"))
+
+        assert ep.drain_events() == []
+
+    def test_keeps_jpg_new_file_with_vision_request(self):
+        jpg = ("NewFile", {"action": "Pulse", "data": {"File": "/mnt/sd/snap.jpg", "Size": 1}})
+        ep = self._make([jpg], vision_request=True)
+
+        self._run(ep.get_events_from_device("CAM001"))
+
+        events = ep.drain_events()
+        assert len(events) == 1
+        assert events[0]["event"] == "recording"
+
+
+class TestRebootDevice:
+    def _run(self, coro):
+        return asyncio.run(coro)
+
+    def _make(self):
+        ep = FakeEventProcessor()
+        ep._add_device("CAM001")
+        ep.upsert_state = MagicMock()
+        ep.increase_api_calls = MagicMock()
+        return ep
+
+    def test_reboot_uses_async_api_and_marks_rebooting(self):
+        ep = self._make()
+        camera = ep.amcrest_devices["CAM001"]["camera"]
+        camera.async_reboot = AsyncMock(return_value="OK\r\n")
+
+        self._run(ep.reboot_device("CAM001"))
+
+        camera.async_reboot.assert_awaited_once()
+        camera.reboot.assert_not_called()
+        assert "reboot" in ep.upsert_state.call_args.kwargs["internal"]
+
+    def test_reboot_comm_error_is_logged(self):
+        ep = self._make()
+        ep.amcrest_devices["CAM001"]["camera"].async_reboot = AsyncMock(side_effect=CommError("timeout"))
+
+        self._run(ep.reboot_device("CAM001"))
+
+        ep.logger.error.assert_called_once()
+        ep.upsert_state.assert_not_called()
+
+
+class TestGetRecordedFile:
+    def _make(self):
+        ep = FakeEventProcessor()
+        ep._add_device("CAM001")
+        ep.is_rebooting = MagicMock(return_value=False)
+        ep.increase_api_calls = MagicMock()
+        ep.mb_to_b = MagicMock(side_effect=lambda mb: mb * 1024 * 1024)
+        return ep
+
+    def test_download_runs_off_the_event_loop(self):
+        ep = self._make()
+        loop_thread = threading.get_ident()
+        download_threads = []
+
+        def _download(file):
+            download_threads.append(threading.get_ident())
+            return b"mp4data"
+
+        ep.amcrest_devices["CAM001"]["camera"].download_file = MagicMock(side_effect=_download)
+
+        result = asyncio.run(ep.get_recorded_file("CAM001", "/mnt/sd/clip.mp4", encode=False))
+
+        assert result == "mp4data"
+        assert download_threads and download_threads[0] != loop_thread
@@ -0,0 +1,28 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2025 Jeff Culverhouse
+import sys
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+from amcrest2mqtt.app import run
+
+
+class TestRun:
+    def test_falls_back_to_asyncio_when_uvloop_missing(self):
+        coro = MagicMock()
+
+        # a None entry in sys.modules makes `import uvloop` raise ImportError
+        with patch.dict(sys.modules, {"uvloop": None}), patch("amcrest2mqtt.app.asyncio.run", return_value=0) as asyncio_run:
+            assert run(coro) == 0
+
+        asyncio_run.assert_called_once_with(coro)
+
+    def test_uses_uvloop_when_installed(self):
+        coro = MagicMock()
+        uvloop = SimpleNamespace(run=MagicMock(return_value=0))
+
+        with patch.dict(sys.modules, {"uvloop": uvloop}), patch("amcrest2mqtt.app.asyncio.run") as asyncio_run:
+            assert run(coro) == 0
+
+        uvloop.run.assert_called_once_with(coro)
+        asyncio_run.assert_not_called()
@@ -2,10 +2,11 @@
 # Copyright (c) 2025 Jeff Culverhouse
 import os
 import pytest
+import yaml
 from unittest.mock import MagicMock
 
 from mqtt_helper import ConfigError
-from amcrest2mqtt.mixins.helpers import HelpersMixin
+from amcrest2mqtt.mixins.helpers import YAML_LOADER, HelpersMixin, slugify
 
 
 class FakeHelpers(HelpersMixin):
@@ -13,6 +14,7 @@ class FakeHelpers(HelpersMixin):
         self.logger = MagicMock()
         self.running = True
         self.dirty: dict[str, set[tuple[str, str]]] = {}
+        self.stat_topics: dict[tuple[str, ...], str] = {}
 
 
 class TestLoadConfigFromFile:
@@ -50,6 +52,10 @@ amcrest:
         assert config["amcrest"]["names"] == ["Front Yard"]
         assert config["config_from"] == "file"
 
+    def test_config_loader_stays_safe(self):
+        with pytest.raises(yaml.constructor.ConstructorError):
+            yaml.load("!!python/object/apply:os.getcwd []", Loader=YAML_LOADER)
+
 
 class TestLoadConfigDefaults:
     def test_defaults_when_no_file(self, tmp_path, monkeypatch):
@@ -188,6 +194,36 @@ class TestUtilities:
         assert helpers.b_to_gb(1073741824) == 1.0
 
 
+class TestGetStatT:
+    def test_builds_topic_once_per_key(self):
+        helpers = FakeHelpers()
+        helpers.mqtt_helper = MagicMock()
+        helpers.mqtt_helper.stat_t = MagicMock(side_effect=lambda *args: "/".join(["amcrest2mqtt", *args]))
+
+        first = helpers.get_stat_t("CAM001", "switch", "privacy")
+        second = helpers.get_stat_t("CAM001", "switch", "privacy")
+        other = helpers.get_stat_t("CAM001", "switch", "motion_detection")
+
+        assert first == second == "amcrest2mqtt/CAM001/switch/privacy"
+        assert other == "amcrest2mqtt/CAM001/switch/motion_detection"
+        assert helpers.mqtt_helper.stat_t.call_count == 2
+
+
+class TestGetDeviceNameSlug:
+    def test_slugifies_device_name(self):
+        helpers = FakeHelpers()
+        helpers.devices = {"CAM001": {"component": {"device": {"name": "Front Yard (East)"}}}}
+
+        assert helpers.get_device_name_slug("CAM001") == "front_yard_east_"
+
+    def test_slugify_is_cached(self):
+        slugify.cache_clear()
+        slugify("Back Yard")
+        slugify("Back Yard")
+
+        assert slugify.cache_info().hits == 1
+
+
 class TestReadFile:
     def test_reads_file(self, tmp_path):
         f = tmp_path / "test.txt"
@@ -256,3 +292,56 @@ class TestUpsertDevice:
 
         assert helpers.states["SERIAL123"]["switch"]["privacy"] == "OFF"
         assert helpers.states["SERIAL123"]["switch"]["motion_detection"] == "ON"
+
+    def test_upsert_device_detects_change_to_existing_device(self):
+        helpers = FakeHelpers()
+        helpers.devices = {}
+        helpers.states = {}
+
+        helpers.upsert_device("SERIAL123", component={"device": {"name": "Front Yard"}})
+        changed = helpers.upsert_device("SERIAL123", component={"device": {"name": "Back Yard"}})
+
+        assert changed is True
+
+    def test_upsert_state_detects_change_to_existing_state(self):
+        helpers = FakeHelpers()
+        helpers.devices = {}
+        helpers.states = {}
+
+        helpers.upsert_state("SERIAL123", switch={"privacy": "OFF"})
+        changed = helpers.upsert_state("SERIAL123", switch={"privacy": "ON"})
+
+        assert changed is True
+
+    def test_upsert_state_same_data_returns_false(self):
+        helpers = FakeHelpers()
+        helpers.devices = {}
+        helpers.states = {}
+
+        helpers.upsert_state("SERIAL123", switch={"privacy": "OFF"}, webrtc="http://host/webrtc")
+        helpers.dirty.clear()
+        changed = helpers.upsert_state("SERIAL123", switch={"privacy": "OFF"}, webrtc="http://host/webrtc")
+
+        assert changed is False
+        assert helpers.dirty["SERIAL123"] == set()
+
+    def test_upsert_state_new_empty_section_is_a_change(self):
+        helpers = FakeHelpers()
+        helpers.devices = {}
+        helpers.states = {}
+
+        changed = helpers.upsert_state("SERIAL123", internal={})
+
+        assert changed is True
+        assert helpers.states["SERIAL123"]["internal"] == {}
+
+    def test_upsert_state_only_dirties_changed_keys(self):
+        helpers = FakeHelpers()
+        helpers.devices = {}
+        helpers.states = {}
+
+        helpers.upsert_state("SERIAL123", switch={"privacy": "OFF", "motion_detection": "ON"})
+        helpers.dirty.clear()
+        helpers.upsert_state("SERIAL123", switch={"privacy": "ON", "motion_detection": "ON"})
+
+        assert helpers.dirty["SERIAL123"] == {("switch", "privacy")}
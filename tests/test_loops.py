@@ -23,7 +23,8 @@ class FakeLooper(HelpersMixin, LoopsMixin):
         pass
 
     async def check_for_events(self):
-        pass
+        # the real one blocks on the event queue; check_event_queue_loop relies on that to yield
+        await asyncio.sleep(3600)
 
     async def collect_all_device_snapshots(self):
         pass
@@ -68,6 +69,35 @@ class TestDeviceLoop:
         looper.logger.debug.assert_called()
 
 
+class TestCheckEventQueueLoop:
+    @pytest.mark.asyncio
+    async def test_waits_on_queue_without_sleeping(self):
+        looper = FakeLooper()
+        call_count = 0
+
+        async def mock_check():
+            nonlocal call_count
+            call_count += 1
+            looper.running = False
+
+        looper.check_for_events = mock_check
+
+        with patch("amcrest2mqtt.mixins.loops.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+            await looper.check_event_queue_loop()
+
+        assert call_count == 1
+        mock_sleep.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_handles_cancelled_error(self):
+        looper = FakeLooper()
+        looper.check_for_events = AsyncMock(side_effect=asyncio.CancelledError)
+
+        await looper.check_event_queue_loop()
+
+        looper.logger.debug.assert_called()
+
+
 class TestHeartbeat:
     @pytest.mark.asyncio
     async def test_calls_heartbeat_ready(self):
@@ -141,3 +171,28 @@ class TestMainLoop:
         assert len(created_tasks) == 6
         assert "device_loop" in created_tasks
         assert "heartbeat" in created_tasks
+
+    @pytest.mark.asyncio
+    async def test_installs_eager_task_factory(self):
+        looper = FakeLooper()
+        looper.running = False
+        looper.handle_signal = MagicMock()
+        loop = asyncio.get_running_loop()
+        previous = loop.get_task_factory()
+
+        try:
+            with (
+                patch("amcrest2mqtt.mixins.loops.signal.signal"),
+                patch("amcrest2mqtt.mixins.loops.asyncio.gather", new_callable=AsyncMock),
+            ):
+                await looper.main_loop()
+
+            assert loop.get_task_factory() is asyncio.eager_task_factory
+        finally:
+            loop.set_task_factory(previous)
+            # the loops really started (each is parked in its first wait); stop them
+            looper.running = False
+            pending = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
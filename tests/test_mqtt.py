@@ -2,10 +2,11 @@
 # Copyright (c) 2025 Jeff Culverhouse
 import json
 import pytest
-from unittest.mock import AsyncMock, MagicMock
+import socket
+from unittest.mock import AsyncMock, MagicMock, patch
 
-from mqtt_helper import parse_device_topic
-from amcrest2mqtt.mixins.mqtt import MqttMixin
+from mqtt_helper import BaseMqttMixin, parse_device_topic
+from amcrest2mqtt.mixins.mqtt import MQTT_MAX_QUEUED, MqttMixin
 
 
 class FakeMqtt(MqttMixin):
@@ -49,6 +50,38 @@ class TestMqttSubscriptionTopics:
         assert len(topics) == 5
 
 
+class TestMqttcCreate:
+    @pytest.mark.asyncio
+    async def test_caps_outgoing_queue(self):
+        mqtt = FakeMqtt()
+        mqtt.mqttc = MagicMock()
+
+        with patch.object(BaseMqttMixin, "mqttc_create", AsyncMock()) as base_create:
+            await mqtt.mqttc_create()
+
+        base_create.assert_awaited_once()
+        mqtt.mqttc.max_queued_messages_set.assert_called_once_with(MQTT_MAX_QUEUED)
+
+    @pytest.mark.asyncio
+    async def test_sets_nodelay_on_current_and_future_sockets(self):
+        mqtt = FakeMqtt()
+        mqtt.mqttc = MagicMock()
+        sock = mqtt.mqttc.socket.return_value
+
+        with patch.object(BaseMqttMixin, "mqttc_create", AsyncMock()):
+            await mqtt.mqttc_create()
+
+        sock.setsockopt.assert_called_once_with(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        assert mqtt.mqttc.on_socket_open == mqtt.mqtt_on_socket_open
+
+    def test_socket_without_setsockopt_is_ignored(self):
+        mqtt = FakeMqtt()
+
+        mqtt.mqtt_on_socket_open(None, None, object())
+
+        mqtt.logger.debug.assert_called_once()
+
+
 class TestMqttOnMessage:
     @pytest.mark.asyncio
     async def test_ha_online_triggers_handle_homeassistant_message(self):
@@ -96,6 +129,19 @@ class TestMqttOnMessage:
         mqtt.handle_homeassistant_message.assert_not_awaited()
         mqtt.handle_device_topic.assert_not_awaited()
 
+    @pytest.mark.asyncio
+    async def test_plain_command_skips_json_decoder(self, monkeypatch):
+        mqtt = FakeMqtt()
+        mqtt.handle_device_topic = AsyncMock()
+        decoder = MagicMock()
+        monkeypatch.setattr("amcrest2mqtt.mixins.mqtt.decode_mqtt_payload", decoder)
+
+        msg = _make_msg("amcrest2mqtt/amcrest2mqtt_SERIAL123/button/reboot/set", "PRESS")
+        await mqtt.mqtt_on_message(None, None, msg)
+
+        decoder.assert_not_called()
+        assert mqtt.handle_device_topic.await_args.args[1] == "PRESS"
+
 
 class TestParseDeviceTopic:
     def test_parses_valid_switch_topic(self):
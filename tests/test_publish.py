@@ -1,8 +1,9 @@
 # SPDX-License-Identifier: MIT
 # Copyright (c) 2025 Jeff Culverhouse
 import json
+import orjson
 import pytest
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from amcrest2mqtt.mixins.publish import PublishMixin
 from amcrest2mqtt.mixins.helpers import HelpersMixin
@@ -28,6 +29,8 @@ class FakePublisher(HelpersMixin, PublishMixin):
         self.devices = {}
         self.states = {}
         self.dirty: dict[str, set[tuple[str, str]]] = {}
+        self.stat_topics: dict[tuple[str, ...], str] = {}
+        self.discovery_payloads: dict[str, bytes] = {}
 
 
 async def _fake_to_thread(fn, *args):
@@ -84,6 +87,21 @@ class TestServiceDiscovery:
         assert payload["cmps"]["api_calls"]["p"] == "sensor"
         assert payload["cmps"]["rate_limited"]["p"] == "binary_sensor"
 
+    @pytest.mark.asyncio
+    async def test_service_discovery_serialized_once(self):
+        pub = FakePublisher()
+        pub.build_service_discovery = MagicMock(wraps=pub.build_service_discovery)
+
+        with patch("amcrest2mqtt.mixins.publish.asyncio") as mock_asyncio:
+            mock_asyncio.to_thread = _fake_to_thread
+            await pub.publish_service_discovery()
+            await pub.publish_service_discovery()
+
+        pub.build_service_discovery.assert_called_once()
+        payloads = [c.args[1] for c in pub.mqtt_helper.safe_publish.call_args_list]
+        assert len(payloads) == 2
+        assert payloads[0] == payloads[1]
+
 
 class TestServiceAvailability:
     @pytest.mark.asyncio
@@ -152,6 +170,7 @@ class TestServiceState:
             if "last_call" in c.args[0]:
                 # should be ISO format with timezone info
                 assert "T" in str(c.args[1])
+                assert str(c.args[1]).endswith("+00:00")
                 break
         else:
             pytest.fail("last_call topic not published")
@@ -211,6 +230,43 @@ class TestDeviceDiscovery:
 
         assert pub.states["CAM001"]["internal"]["discovered"] is True
 
+    @pytest.mark.asyncio
+    async def test_multiple_devices_published_in_one_batch(self):
+        pub = FakePublisher()
+        pub.devices["CAM001"] = {"component": {"device": {"name": "Front Yard"}}}
+        pub.devices["CAM002"] = {"component": {"device": {"name": "Back Yard"}}}
+        pub.states["CAM001"] = {}
+        pub.states["CAM002"] = {}
+        to_thread = AsyncMock(side_effect=_fake_to_thread)
+
+        with patch("amcrest2mqtt.mixins.publish.asyncio") as mock_asyncio:
+            mock_asyncio.to_thread = to_thread
+            await pub.publish_device_discovery("CAM001", "CAM002")
+
+        assert to_thread.await_count == 1
+        topics = [c.args[0] for c in pub.mqtt_helper.safe_publish.call_args_list]
+        assert topics == [
+            "homeassistant/device/amcrest2mqtt_CAM001/config",
+            "homeassistant/device/amcrest2mqtt_CAM002/config",
+        ]
+        assert pub.states["CAM002"]["internal"]["discovered"] is True
+
+    @pytest.mark.asyncio
+    async def test_device_discovery_payload_reused(self):
+        pub = FakePublisher()
+        pub.devices["CAM001"] = {"component": {"device": {"name": "Front Yard"}}}
+        pub.states["CAM001"] = {}
+
+        with patch("amcrest2mqtt.mixins.publish.asyncio") as mock_asyncio, patch("amcrest2mqtt.mixins.publish.orjson.dumps", wraps=orjson.dumps) as dumps:
+            mock_asyncio.to_thread = _fake_to_thread
+            await pub.publish_device_discovery("CAM001")
+            await pub.publish_device_discovery("CAM001")
+
+        dumps.assert_called_once()
+        first, second = (c.args[1] for c in pub.mqtt_helper.safe_publish.call_args_list)
+        assert first is second
+        assert json.loads(first) == {"device": {"name": "Front Yard"}}
+
 
 class TestDeviceAvailability:
     @pytest.mark.asyncio
@@ -297,9 +353,27 @@ class TestDeviceState:
         payloads = {c.args[0]: c.args[1] for c in pub.mqtt_helper.safe_publish.call_args_list}
         for topic, value in payloads.items():
             if "flag" in topic:
-                assert value == json.dumps(True)
+                assert json.loads(value) is True
             if "items" in topic:
-                assert value == json.dumps([1, 2, 3])
+                assert json.loads(value) == [1, 2, 3]
+
+    @pytest.mark.asyncio
+    async def test_scalars_published_raw(self):
+        pub = FakePublisher()
+        pub.states["CAM001"] = {
+            "switch": {"privacy": "OFF"},
+            "sensor": {"storage_used": 50.2},
+            "binary_sensor": {"motion": False},
+        }
+
+        with patch("amcrest2mqtt.mixins.publish.asyncio") as mock_asyncio:
+            mock_asyncio.to_thread = _fake_to_thread
+            await pub.publish_device_state("CAM001", publish_all=True)
+
+        payloads = {c.args[0]: c.args[1] for c in pub.mqtt_helper.safe_publish.call_args_list}
+        assert payloads["amcrest2mqtt/CAM001/switch/privacy"] == "OFF"
+        assert payloads["amcrest2mqtt/CAM001/sensor/storage_used"] == 50.2
+        assert payloads["amcrest2mqtt/CAM001/binary_sensor/motion"] == b"false"
 
     @pytest.mark.asyncio
     async def test_attributes_published_as_json_object(self):
@@ -320,3 +394,31 @@ class TestDeviceState:
                 break
         else:
             pytest.fail("attributes topic not published")
+
+    @pytest.mark.asyncio
+    async def test_publishes_all_keys_in_one_thread_hop(self):
+        pub = FakePublisher()
+        pub.states["CAM001"] = {
+            "switch": {"privacy": "OFF", "motion_detection": "ON"},
+            "sensor": {"storage_used": "50.2"},
+        }
+        to_thread = AsyncMock(side_effect=_fake_to_thread)
+
+        with patch("amcrest2mqtt.mixins.publish.asyncio") as mock_asyncio:
+            mock_asyncio.to_thread = to_thread
+            await pub.publish_device_state("CAM001", publish_all=True)
+
+        assert to_thread.await_count == 1
+        assert pub.mqtt_helper.safe_publish.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_nothing_dirty_publishes_nothing(self):
+        pub = FakePublisher()
+        pub.states["CAM001"] = {"switch": {"privacy": "OFF"}}
+        to_thread = AsyncMock(side_effect=_fake_to_thread)
+
+        with patch("amcrest2mqtt.mixins.publish.asyncio") as mock_asyncio:
+            mock_asyncio.to_thread = to_thread
+            await pub.publish_device_state("CAM001")
+
+        to_thread.assert_not_awaited()